@@ -1,22 +1,35 @@
-from dataclasses import asdict, dataclass, field
-from typing import Any, Collection, Union
+import traceback
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Collection, Mapping, Union
 
 from fixit.common.report import BaseLintRuleReport
 from libcst import ParserSyntaxError
 
 from algorithms_keeper.constants import Label
 
-# Mapping of rule to the appropriate label.
-RULE_TO_LABEL: dict[str, str] = {
-    "RequireDescriptiveNameRule": Label.DESCRIPTIVE_NAME,
-    "RequireDoctestRule": Label.REQUIRE_TEST,
-    "RequireTypeHintRule": Label.TYPE_HINT,
-}
+# Mapping of rule to the appropriate label. This is a read-only view as the mapping
+# is shared by all the records and should not be changed at runtime.
+RULE_TO_LABEL: Mapping[str, str] = MappingProxyType(
+    {
+        "RequireDescriptiveNameRule": Label.DESCRIPTIVE_NAME,
+        "RequireDoctestRule": Label.REQUIRE_TEST,
+        "RequireTypeHintRule": Label.TYPE_HINT,
+    }
+)
+
+# All the labels which are managed by the parser as per the violated rules.
+_MANAGED_LABELS: frozenset[str] = frozenset(RULE_TO_LABEL.values())
 
 MULTIPLE_COMMENT_SEPARATOR: str = "\n\n"
 
+PARSE_ERROR_COMMENT: str = (
+    "An error occured while parsing the file: `{filepath}`\n"
+    + "```python\n{message}\n```"
+)
 
-@dataclass(frozen=False)
+
+@dataclass(frozen=False, slots=True)
 class ReviewComment:
     # Text of the review comment. This is different from the body of the review itself.
     body: str
@@ -37,6 +50,16 @@ class ReviewComment:
     # shown for context.
     side: str = field(init=False, default="RIGHT")
 
+    # Any further messages for the same line. These are joined with the *body* only
+    # while collecting the comments instead of growing the *body* for every message.
+    fragments: list[str] = field(init=False, default_factory=list, repr=False)
+
+    def full_body(self) -> str:
+        """Return the *body* along with all the fragments for the comment."""
+        if not self.fragments:
+            return self.body
+        return MULTIPLE_COMMENT_SEPARATOR.join((self.body, *self.fragments))
+
 
 @dataclass(frozen=False)
 class PullRequestReviewRecord:
@@ -53,6 +76,13 @@ class PullRequestReviewRecord:
     # Store all the ``ReviewComment`` instances.
     _comments: list[ReviewComment] = field(default_factory=list, init=False, repr=False)
 
+    # Index of the ``ReviewComment`` instances keyed by the filepath and then by the
+    # line number. This is used to find the existing comment for a line without going
+    # through all the comments every time a report is added.
+    _comment_index: dict[str, dict[int, ReviewComment]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     # A set of rules which were violated during the runtime of the parser for the
     # current pull request. This is being represented as ``set`` internally to avoid
     # duplication.
@@ -65,20 +95,29 @@ class PullRequestReviewRecord:
 
         If the line on which the comment is to be posted already exists, then the
         *body* is simply added to the respective comment's body provided it is in the
-        same file. This is done to avoid adding multiple comments on the same line.
+        same file and is not already a part of it. This is done to avoid adding
+        multiple comments on the same line.
         """
+        file_comments = self._comment_index.setdefault(filepath, {})
         for report in reports:
             self._violated_rules.add(report.code)
-            if self._lineno_exist(report.message, filepath, report.line):
-                continue
-            self._comments.append(ReviewComment(report.message, filepath, report.line))
+            line = report.line
+            message = report.message
+            comment = file_comments.get(line)
+            if comment is not None:
+                # The same message could be reported multiple times for a line, which
+                # should only be added once.
+                if message != comment.body and message not in comment.fragments:
+                    comment.fragments.append(message)
+            else:
+                comment = ReviewComment(message, filepath, line)
+                file_comments[line] = comment
+                self._comments.append(comment)
 
     def add_error(
         self, exc: Union[SyntaxError, ParserSyntaxError], filepath: str
     ) -> None:
         """Add any exception faced while parsing the source code."""
-        import traceback
-
         message = traceback.format_exc(limit=1)
         # It seems that ``ParserSyntaxError`` is not a subclass of ``SyntaxError``,
         # the same information is stored under a different attribute. There is no
@@ -87,11 +126,11 @@ class PullRequestReviewRecord:
             lineno = exc.lineno or 1
         else:
             lineno = exc.raw_line
-        body = (
-            f"An error occured while parsing the file: `{filepath}`\n"
-            f"```python\n{message}\n```"
-        )
-        self._comments.append(ReviewComment(body, filepath, lineno))
+        body = PARSE_ERROR_COMMENT.format(filepath=filepath, message=message)
+        # The file could not be parsed, so there won't be any other comments for it.
+        comment = ReviewComment(body, filepath, lineno)
+        self._comment_index.setdefault(filepath, {})[lineno] = comment
+        self._comments.append(comment)
 
     def fill_labels(self, current_labels: Collection[str]) -> None:
         """Fill the ``add_labels`` and ``remove_labels`` with the appropriate data.
@@ -100,48 +139,47 @@ class PullRequestReviewRecord:
 
         *current_labels* is a collection of labels present on the pull request.
         """
-        for rule, label in RULE_TO_LABEL.items():
-            if rule in self._violated_rules:
-                if label not in current_labels and label not in self.labels_to_add:
-                    self.labels_to_add.append(label)
-            elif label in current_labels and label not in self.labels_to_remove:
-                self.labels_to_remove.append(label)
+        current = set(current_labels)
+        # Not all the violated rules have a label associated with them.
+        violated = {
+            RULE_TO_LABEL[rule]
+            for rule in self._violated_rules
+            if rule in RULE_TO_LABEL
+        }
+        self.labels_to_add = sorted(violated - current)
+        self.labels_to_remove = sorted((_MANAGED_LABELS - violated) & current)
 
     def collect_comments(self) -> list[dict[str, Any]]:
         """Return all the review comments in the record instance.
 
         This is how GitHub wants the *comments* value while creating the review.
         """
-        return [asdict(comment) for comment in self._comments]
+        return [
+            {
+                "body": comment.full_body(),
+                "path": comment.path,
+                "line": comment.line,
+                "side": comment.side,
+            }
+            for comment in self._comments
+        ]
 
     def collect_review_contents(self) -> list[str]:
         """Collect all the review comments as list of strings.
 
-        If the comment body contains multiple comments from rules being violated
-        multiple time, each comment will be replaced in a way to maintain consistency
-        in the following format.
+        If the comment contains multiple messages from rules being violated multiple
+        time, each message will be prefixed in a way to maintain consistency in the
+        following format.
 
         The format will be: ``filepath:lineno: message``
         """
         content = []
         for comment in self._comments:
-            if MULTIPLE_COMMENT_SEPARATOR in comment.body:
-                comment.body = comment.body.replace(
-                    MULTIPLE_COMMENT_SEPARATOR,
-                    f"{MULTIPLE_COMMENT_SEPARATOR}**{comment.path}:{comment.line}:** ",
+            prefix = f"**{comment.path}:{comment.line}:** "
+            content.append(
+                prefix
+                + f"{MULTIPLE_COMMENT_SEPARATOR}{prefix}".join(
+                    (comment.body, *comment.fragments)
                 )
-            content.append(f"**{comment.path}:{comment.line}:** {comment.body}")
+            )
         return content
-
-    def _lineno_exist(self, body: str, filepath: str, lineno: int) -> bool:
-        """Determine whether any review comment is registered for the given *lineno*
-        for the given *filepath*.
-
-        If ``True``, add the provided *body* to the respective comment body. This helps
-        in avoiding multiple review comments on the same line.
-        """
-        for comment in self._comments:
-            if comment.line == lineno and comment.path == filepath:
-                comment.body += f"{MULTIPLE_COMMENT_SEPARATOR}{body}"
-                return True
-        return False
@@ -20,6 +20,9 @@ INVALID_SNAKE_CASE_NAME_COMMENT: str = (
     + "Please update the following name accordingly: `{nodename}`"
 )
 
+# The matcher is constructed once here instead of on every visit to the node.
+SELF_ATTRIBUTE_MATCHER: m.Attribute = m.Attribute(value=m.Name(value="self"))
+
 
 class NamingConvention(Enum):
     CAMEL_CASE = INVALID_CAMEL_CASE_NAME_COMMENT
@@ -33,19 +36,20 @@ class NamingConvention(Enum):
         """
         if self is NamingConvention.CAMEL_CASE:
             name = name.strip("_")
-            if name[0].islower() or "_" in name:
-                return False
-        else:
-            if name.lower() != name and name.upper() != name:
-                return False
-        return True
+            # A name made up of only underscores has nothing to be checked.
+            return not name or not (name[0].islower() or "_" in name)
+        # Most of the names are either all lowercase or all uppercase, which can be
+        # checked without creating the case converted copies of the name.
+        if name.islower() or name.isupper():
+            return True
+        return name.lower() == name or name.upper() == name
 
 
 class NamingConventionRule(CstLintRule):
 
     METADATA_DEPENDENCIES = (QualifiedNameProvider,)  # type: ignore
 
-    VALID = [
+    VALID = (
         Valid("type_hint: str"),
         Valid("type_hint_var: int = 5"),
         Valid("CONSTANT_WITH_UNDERSCORE12 = 10"),
@@ -55,11 +59,15 @@ class NamingConventionRule(CstLintRule):
         Valid("class _PrivateClass: pass"),
         Valid("class SomeClass: pass"),
         Valid("class One: pass"),
+        Valid("class _: pass"),
         Valid("def oneword(): pass"),
         Valid("def some_extra_words(): pass"),
         Valid("all = names_are = valid_in_multiple_assign = 5"),
         Valid("(walrus := 'operator')"),
         Valid("multiple, valid, assignments = 1, 2, 3"),
+        Valid("_ = 'no cased characters'"),
+        Valid("for _ in range(5): pass"),
+        Valid("def _(): pass"),
         Valid(
             """
             class Spam:
@@ -85,9 +93,9 @@ class NamingConventionRule(CstLintRule):
             some_matrix: Matrix = [1, 2]
             """
         ),
-    ]
+    )
 
-    INVALID = [
+    INVALID = (
         Invalid("type_Hint_Var: int = 5"),
         Invalid("hellO = 'world'"),
         Invalid("ranDom_UpPercAse = 'testing'"),
@@ -103,6 +111,8 @@ class NamingConventionRule(CstLintRule):
         Invalid("def func(invalidParam, valid_param): pass"),
         Invalid("multiple, inValid, assignments = 1, 2, 3"),
         Invalid("[inside, list, inValid] = Invalid, 2, 3"),
+        Invalid("[nested, [list, inValid]] = 1, [2, 3]"),
+        Invalid("self.valid, self.inValid = 1, 2"),
         Invalid(
             """
             class Spam:
@@ -111,13 +121,23 @@ class NamingConventionRule(CstLintRule):
                     self._Bar = bar
             """
         ),
-    ]
+    )
 
     def __init__(self, context: CstContext) -> None:
         super().__init__(context)
         self._assigntarget_counter: int = 0
 
     def visit_Assign(self, node: cst.Assign) -> None:
+        names = [
+            target_node.target
+            for target_node in node.targets
+            if isinstance(target_node.target, cst.Name)
+        ]
+        # Tuple unpacking, attribute and subscript targets are handled by the other
+        # visit functions, so there's no need to look up the metadata for them.
+        if not names:
+            return None
+
         metadata: Optional[Collection[QualifiedName]] = self.get_metadata(
             QualifiedNameProvider, node.value, None
         )
@@ -131,22 +151,15 @@ class NamingConventionRule(CstLintRule):
                 if qualname.name.startswith(("typing", "collections")):
                     return None
 
-        for target_node in node.targets:
-            if m.matches(target_node, m.AssignTarget(target=m.Name())):
-                nodename = cst.ensure_type(target_node.target, cst.Name).value
-                self._validate_nodename(node, nodename, NamingConvention.SNAKE_CASE)
+        for name in names:
+            self._validate_nodename(node, name.value, NamingConvention.SNAKE_CASE)
 
     def visit_AnnAssign(self, node: cst.AnnAssign) -> None:
         # The assignment value is optional, as it is possible to annotate an
         # expression without assigning to it: ``var: int``
-        if m.matches(
-            node,
-            m.AnnAssign(
-                target=m.Name(), value=m.MatchIfTrue(lambda value: value is not None)
-            ),
-        ):
-            nodename = cst.ensure_type(node.target, cst.Name).value
-            self._validate_nodename(node, nodename, NamingConvention.SNAKE_CASE)
+        target = node.target
+        if isinstance(target, cst.Name) and node.value is not None:
+            self._validate_nodename(node, target.value, NamingConvention.SNAKE_CASE)
 
     def visit_AssignTarget(self, node: cst.AssignTarget) -> None:
         self._assigntarget_counter += 1
@@ -162,7 +175,7 @@ class NamingConventionRule(CstLintRule):
         # about the ones coming from assignments.
         if self._assigntarget_counter > 0:
             # We only care about assignment attribute to *self*.
-            if m.matches(node, m.Attribute(value=m.Name(value="self"))):
+            if m.matches(node, SELF_ATTRIBUTE_MATCHER):
                 self._validate_nodename(
                     node, node.attr.value, NamingConvention.SNAKE_CASE
                 )
@@ -171,22 +184,22 @@ class NamingConventionRule(CstLintRule):
         # We only care about elements in *List* or *Tuple* specifically coming from
         # inside the multiple assignments.
         if self._assigntarget_counter > 0:
-            if m.matches(node, m.Element(value=m.Name())):
-                nodename = cst.ensure_type(node.value, cst.Name).value
-                self._validate_nodename(node, nodename, NamingConvention.SNAKE_CASE)
+            value = node.value
+            if isinstance(value, cst.Name):
+                self._validate_nodename(node, value.value, NamingConvention.SNAKE_CASE)
 
     def visit_For(self, node: cst.For) -> None:
-        if m.matches(node, m.For(target=m.Name())):
-            nodename = cst.ensure_type(node.target, cst.Name).value
-            self._validate_nodename(node, nodename, NamingConvention.SNAKE_CASE)
+        target = node.target
+        if isinstance(target, cst.Name):
+            self._validate_nodename(node, target.value, NamingConvention.SNAKE_CASE)
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
         self._validate_nodename(node, node.name.value, NamingConvention.SNAKE_CASE)
 
     def visit_NamedExpr(self, node: cst.NamedExpr) -> None:
-        if m.matches(node, m.NamedExpr(target=m.Name())):
-            nodename = cst.ensure_type(node.target, cst.Name).value
-            self._validate_nodename(node, nodename, NamingConvention.SNAKE_CASE)
+        target = node.target
+        if isinstance(target, cst.Name):
+            self._validate_nodename(node, target.value, NamingConvention.SNAKE_CASE)
 
     def visit_Param(self, node: cst.Param) -> None:
         self._validate_nodename(node, node.name.value, NamingConvention.SNAKE_CASE)
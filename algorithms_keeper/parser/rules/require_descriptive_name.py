@@ -10,7 +10,7 @@ MESSAGE: str = "Please provide descriptive name for the {nodetype}: `{nodename}`
 
 class RequireDescriptiveNameRule(CstLintRule):
 
-    VALID = [
+    VALID = (
         Valid(
             """
             class DescriptiveName:
@@ -36,9 +36,9 @@ class RequireDescriptiveNameRule(CstLintRule):
                 pass
             """
         ),
-    ]
+    )
 
-    INVALID = [
+    INVALID = (
         Invalid(
             """
             class T:
@@ -64,7 +64,7 @@ class RequireDescriptiveNameRule(CstLintRule):
                 pass
             """
         ),
-    ]
+    )
 
     def visit_ClassDef(self, node: cst.ClassDef) -> None:
         self._validate_name_length(node, "class")
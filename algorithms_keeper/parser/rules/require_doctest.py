@@ -16,7 +16,7 @@ INIT: str = "__init__"
 
 class RequireDoctestRule(CstLintRule):
 
-    VALID = [
+    VALID = (
         # Module-level docstring contains doctest.
         Valid(
             """
@@ -151,9 +151,9 @@ class RequireDoctestRule(CstLintRule):
                     pass
             """
         ),
-    ]
+    )
 
-    INVALID = [
+    INVALID = (
         Invalid(
             """
             def bar():
@@ -197,7 +197,7 @@ class RequireDoctestRule(CstLintRule):
                 pass
             """
         ),
-    ]
+    )
 
     def __init__(self, context: CstContext) -> None:
         super().__init__(context)
@@ -16,7 +16,7 @@ IGNORE_PARAM: set[str] = {"self", "cls"}
 
 class RequireTypeHintRule(CstLintRule):
 
-    VALID = [
+    VALID = (
         Valid(
             """
             def func() -> str:
@@ -60,9 +60,9 @@ class RequireTypeHintRule(CstLintRule):
             lambda closure: lambda inside: closure + inside
             """
         ),
-    ]
+    )
 
-    INVALID = [
+    INVALID = (
         Invalid(
             """
             def func():
@@ -106,7 +106,7 @@ class RequireTypeHintRule(CstLintRule):
                 return wrapper(foo)
             """
         ),
-    ]
+    )
 
     def __init__(self, context: CstContext) -> None:
         super().__init__(context)
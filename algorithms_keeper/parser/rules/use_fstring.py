@@ -15,18 +15,18 @@ class UseFstringRule(CstLintRule):
         + "more readable and efficient."
     )
 
-    VALID = [
+    VALID = (
         Valid("assigned='string'; f'testing {assigned}'"),
         Valid("'simple string'"),
         Valid("'concatenated' + 'string'"),
         Valid("b'bytes %s' % 'string'.encode('utf-8')"),
-    ]
+    )
 
-    INVALID = [
+    INVALID = (
         Invalid("'hello, {name}'.format(name='you')"),
         Invalid("'hello, %s' % 'you'"),
         Invalid("r'raw string value=%s' % val"),
-    ]
+    )
 
     def visit_Call(self, node: cst.Call) -> None:
         if m.matches(
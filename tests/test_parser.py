@@ -2,11 +2,14 @@ from pathlib import Path
 from typing import List
 
 import pytest
-from pytest import MonkeyPatch
+from fixit.common.report import BaseLintRuleReport
 
 from algorithms_keeper.constants import Label
 from algorithms_keeper.parser import PythonParser, rules
-from algorithms_keeper.parser.record import PullRequestReviewRecord
+from algorithms_keeper.parser.record import (
+    MULTIPLE_COMMENT_SEPARATOR,
+    PullRequestReviewRecord,
+)
 from algorithms_keeper.utils import File
 
 from .utils import user
@@ -124,7 +127,7 @@ def test_record_error() -> None:
         ("descriptive_name.py", 8),
     ),
 )
-def test_lineno_exist(filename: str, expected: int) -> None:
+def test_same_line_comments_merged(filename: str, expected: int) -> None:
     parser = get_parser(filename)
     for file in parser.files_to_check(True):
         parser.parse(file, get_source(filename))
@@ -133,7 +136,7 @@ def test_lineno_exist(filename: str, expected: int) -> None:
     assert not parser.labels_to_remove
 
 
-def test_lineno_exist_multiple_types() -> None:
+def test_same_line_comments_merged_multiple_types() -> None:
     # Multiple errors on the same line should result in only one review comment.
     source = "def f(a):\n    return None"
     parser = get_parser("multiple_types.py")
@@ -142,6 +145,12 @@ def test_lineno_exist_multiple_types() -> None:
     assert len(parser._pr_record._comments) == 1
     assert len(parser.labels_to_add) == 3
     assert not parser.labels_to_remove
+    (comment,) = parser.collect_comments()
+    assert comment["body"].count(MULTIPLE_COMMENT_SEPARATOR) == 4
+    (content,) = parser.collect_review_contents()
+    assert content.count("**multiple_types.py:1:** ") == 5
+    # Collecting the review contents should not change the review comments.
+    assert parser.collect_comments() == [comment]
 
 
 def test_same_lineno_multiple_source() -> None:
@@ -187,20 +196,68 @@ def test_same_lineno_multiple_source() -> None:
     ),
 )
 def test_combinations(
-    monkeypatch: MonkeyPatch,
     filename: str,
     expected: int,
     labels: List[str],
     add_count: int,
     remove_count: int,
 ) -> None:
-    # We will set this to ``False`` only for the tests as we want to know whether the
-    # parser_old detected all the missing requirements.
-    monkeypatch.setattr(PullRequestReviewRecord, "_lineno_exist", lambda *args: False)
     parser = get_parser(filename)
     parser.pr_labels = labels
     for file in parser.files_to_check(True):
         parser.parse(file, get_source(file.name))
-    assert len(parser._pr_record._comments) == expected
+    # Multiple comments on the same line are merged into one review comment, but we
+    # want to know whether the parser detected all the missing requirements.
+    assert (
+        sum(len(comment.fragments) + 1 for comment in parser._pr_record._comments)
+        == expected
+    )
     assert len(parser.labels_to_add) == add_count
     assert len(parser.labels_to_remove) == remove_count
+
+
+@pytest.mark.parametrize(
+    "violated_rules, current_labels, labels_to_add, labels_to_remove",
+    (
+        (set(), [], [], []),
+        (set(), [Label.TYPE_HINT, Label.ENHANCEMENT], [], [Label.TYPE_HINT]),
+        ({"NamingConventionRule"}, [Label.REQUIRE_TEST], [], [Label.REQUIRE_TEST]),
+        (
+            {"RequireTypeHintRule", "RequireDoctestRule"},
+            [Label.TYPE_HINT, Label.DESCRIPTIVE_NAME],
+            [Label.REQUIRE_TEST],
+            [Label.DESCRIPTIVE_NAME],
+        ),
+    ),
+)
+def test_fill_labels(
+    violated_rules: set[str],
+    current_labels: List[str],
+    labels_to_add: List[str],
+    labels_to_remove: List[str],
+) -> None:
+    record = PullRequestReviewRecord()
+    record._violated_rules = violated_rules
+    record.fill_labels(current_labels)
+    assert record.labels_to_add == labels_to_add
+    assert record.labels_to_remove == labels_to_remove
+
+
+def test_same_message_same_line() -> None:
+    record = PullRequestReviewRecord()
+    reports = [
+        BaseLintRuleReport(
+            file_path=Path("file.py"), code=code, message=message, line=1, column=0
+        )
+        for code, message in (
+            ("RequireTypeHintRule", "first"),
+            ("RequireTypeHintRule", "first"),
+            ("RequireDoctestRule", "second"),
+            ("RequireTypeHintRule", "first"),
+            ("RequireDoctestRule", "second"),
+        )
+    ]
+    record.add_comments(reports, "file.py")
+    assert record.collect_comments() == [
+        {"body": "first\n\nsecond", "path": "file.py", "line": 1, "side": "RIGHT"}
+    ]
@@ -1,6 +1,6 @@
 import textwrap
 from pathlib import Path
-from typing import List, Optional, Tuple, Type, Union
+from typing import List, Optional, Sequence, Tuple, Type, Union
 
 import pytest
 from fixit import CstLintRule
@@ -51,7 +51,7 @@ def _dedent(src: str) -> str:
 
 def _gen_all_test_cases(rules: LintRuleCollectionT) -> List[GenTestCaseType]:
     """Generate all the test cases for the provided rules."""
-    cases: Optional[List[Union[ValidTestCase, InvalidTestCase]]]
+    cases: Optional[Sequence[Union[ValidTestCase, InvalidTestCase]]]
     all_cases: List[GenTestCaseType] = []
     for rule in rules:
         if not issubclass(rule, CstLintRule):